@@ -1,5 +1,8 @@
-from flask import Flask, jsonify, request
+from flask import Flask, Response, request
+import itertools
+import orjson
 import pymysql
+from dbutils.pooled_db import PooledDB
 from typing import Dict, List
 
 app = Flask(__name__)
@@ -12,38 +15,67 @@ db_config = {
     'database': 'joy_of_painting'
 }
 
+# Shared pool so requests reuse warm connections instead of reconnecting
+pool = PooledDB(creator=pymysql, maxconnections=16, blocking=True, **db_config)
+
+# Explicit column list keeps the response schema stable; the episodes
+# schema is fixed, so the queries are built once at import time
+EPISODE_COLUMNS = (
+    'episode_id', 'title', 'season_number', 'episode_number',
+    'painting_img_src', 'painting_yt_src', 'air_date'
+)
+SELECT_EPISODES = f"SELECT {', '.join(EPISODE_COLUMNS)} FROM episodes"
+SELECT_EPISODE = f"{SELECT_EPISODES} WHERE episode_id = %s"
+
+def ojsonify(obj, status: int = 200) -> Response:
+    """Serialize obj with orjson into a JSON response."""
+    return app.response_class(orjson.dumps(obj), status=status, mimetype='application/json')
+
 def get_db_connection():
-    """Create and return a database connection."""
-    return pymysql.connect(**db_config)
+    """Check out a database connection from the pool."""
+    return pool.connection()
 
 @app.route('/api/episodes', methods=['GET'])
 def get_episodes():
-    """Get all episodes from the database."""
-    try:
+    """Stream all episodes from the database as a JSON array."""
+    def generate():
         with get_db_connection() as connection:
-            with connection.cursor() as cursor:
-                cursor.execute("SELECT * FROM episodes")
-                columns = [desc[0] for desc in cursor.description]
-                results = cursor.fetchall()
-                episodes = [dict(zip(columns, row)) for row in results]
-                return jsonify(episodes)
+            # Unbuffered cursor so rows are pulled from MySQL as they are sent
+            with connection.cursor(pymysql.cursors.SSDictCursor) as cursor:
+                cursor.execute(SELECT_EPISODES)
+                yield b'['
+                separator = b''
+                while chunk := cursor.fetchmany(1000):
+                    yield separator + b','.join(orjson.dumps(row) for row in chunk)
+                    separator = b','
+                yield b']'
+
+    # Run the query before streaming starts so errors still become a 500
+    rows = generate()
+    try:
+        first = next(rows)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return ojsonify({"error": str(e)}, 500)
+
+    response = Response(itertools.chain((first,), rows), mimetype='application/json')
+    # Release the cursor and pooled connection even if the client goes away
+    # before the body has been fully sent
+    response.call_on_close(rows.close)
+    return response
 
 @app.route('/api/episodes/<int:episode_id>', methods=['GET'])
 def get_episode(episode_id: int):
     """Get a specific episode by ID."""
     try:
         with get_db_connection() as connection:
-            with connection.cursor() as cursor:
-                cursor.execute("SELECT * FROM episodes WHERE episode_id = %s", (episode_id,))
-                columns = [desc[0] for desc in cursor.description]
+            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+                cursor.execute(SELECT_EPISODE, (episode_id,))
                 result = cursor.fetchone()
                 if result:
-                    return jsonify(dict(zip(columns, result)))
-                return jsonify({"error": "Episode not found"}), 404
+                    return ojsonify(result)
+                return ojsonify({"error": "Episode not found"}, 404)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return ojsonify({"error": str(e)}, 500)
 
 if __name__ == '__main__':
     app.run(debug=True)
\ No newline at end of file
@@ -1,11 +1,45 @@
 import pymysql
+import ast
 import csv
+import itertools
+import logging
 import os
-from typing import Dict, List, Optional
+import re
+from collections import namedtuple
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Tuple
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
+# Columns picked by header name from the colors CSV
+ColorRow = namedtuple(
+    'ColorRow',
+    ['painting_title', 'season', 'episode', 'img_src', 'youtube_src', 'colors', 'color_hex']
+)
+
+# Subject matter rows: episode code parsed into numbers, plus the names of
+# the subject columns flagged for that episode
+SubjectMatterRow = namedtuple('SubjectMatterRow', ['season', 'episode', 'subject_matters'])
+
+# Subject matter episode codes look like: S01E01
+EPISODE_CODE_PATTERN = re.compile(r'^S(?P<season>\d+)E(?P<episode>\d+)$')
+
+# MySQL error codes raised when LOAD DATA LOCAL INFILE is disabled on the
+# client (ER_NOT_ALLOWED_COMMAND) or the server (ER_CLIENT_LOCAL_FILES_DISABLED)
+LOCAL_INFILE_DISABLED_ERRORS = (1148, 3948)
+
+# Episode dates lines look like: "A Walk in the Woods" (January 11, 1983)
+EPISODE_DATE_PATTERN = re.compile(r'^"(?P<title>[^"]+)" \((?P<date>[A-Za-z]+ \d{1,2}, \d{4})\)')
+
+def split_colors(row: ColorRow) -> List[Tuple[str, str]]:
+    """Return the (color name, hex) pairs listed in a colors row."""
+    names = ast.literal_eval(row.colors)
+    hexes = ast.literal_eval(row.color_hex)
+    return [(name.strip(), hex.strip()) for name, hex in zip(names, hexes)]
+
 class DatabaseManager:
-    def __init__(self, db_config: Dict[str, str]):
+    def __init__(self, db_config: Dict[str, Any]):
         self.db_config = db_config
         self.connection = None
         
@@ -13,16 +47,16 @@ class DatabaseManager:
         """Establish a connection to the MySQL database."""
         try:
             self.connection = pymysql.connect(**self.db_config)
-            print("Connected to MySQL database successfully")
-        except pymysql.MySQLError as e:
-            print(f"Error connecting to MySQL: {e}")
+            logger.info("Connected to MySQL database successfully")
+        except pymysql.MySQLError:
+            logger.exception("Error connecting to MySQL")
             raise
 
     def disconnect(self) -> None:
         """Close the database connection."""
         if self.connection:
             self.connection.close()
-            print("MySQL connection closed")
+            logger.info("MySQL connection closed")
 
     def __enter__(self) -> 'DatabaseManager':
         self.connect()
@@ -33,23 +67,56 @@ class DatabaseManager:
 
 class CSVReader:
     @staticmethod
-    def read_file(filename: str, columns: Optional[List[str]] = None) -> List[Dict]:
-        """Read a CSV file and return a list of dictionaries."""
-        data = []
+    def read_header(filename: str) -> List[str]:
+        """Return the column names from a CSV file's header row."""
+        try:
+            with open(filename, 'r', newline='', encoding='utf-8') as file:
+                return next(csv.reader(file))
+        except Exception:
+            logger.exception("Error reading CSV file %s", filename)
+            raise
+
+    @staticmethod
+    def read_rows(filename: str, columns: List[str]) -> Iterator[List[str]]:
+        """Read a CSV file and yield the named columns of each data row as a list.
+
+        Columns are located by name in the file's header row. A row whose
+        field count does not match the header raises ValueError.
+        """
         try:
             with open(filename, 'r', newline='', encoding='utf-8') as file:
                 reader = csv.reader(file)
-                if columns is None:
-                    columns = next(reader)
-                    file.seek(0)
-                    reader = csv.reader(file)
-                
+                header = next(reader)
+                missing = [column for column in columns if column not in header]
+                if missing:
+                    raise ValueError(f"Missing columns {missing} in {filename}")
+                indexes = [header.index(column) for column in columns]
+
                 for row in reader:
-                    if len(row) == len(columns):
-                        data.append(dict(zip(columns, row)))
-            return data
-        except Exception as e:
-            print(f"Error reading CSV file {filename}: {e}")
+                    if len(row) != len(header):
+                        raise ValueError(
+                            f"Line {reader.line_num} of {filename} has {len(row)} fields, "
+                            f"expected {len(header)}"
+                        )
+                    yield [row[index] for index in indexes]
+        except Exception:
+            logger.exception("Error reading CSV file %s", filename)
+            raise
+
+    @staticmethod
+    def read_episode_dates(filename: str) -> Iterator[Tuple[str, str]]:
+        """Read the episode dates file and yield (title, ISO air date) pairs."""
+        try:
+            with open(filename, 'r', encoding='utf-8') as file:
+                next(file, None)
+                for line_num, line in enumerate(file, start=2):
+                    match = EPISODE_DATE_PATTERN.match(line)
+                    if match is None:
+                        raise ValueError(f"Line {line_num} of {filename} is not a dated title")
+                    air_date = datetime.strptime(match['date'], '%B %d, %Y').date()
+                    yield match['title'].strip(), air_date.isoformat()
+        except Exception:
+            logger.exception("Error reading episode dates file %s", filename)
             raise
 
 class DataImporter:
@@ -69,20 +136,25 @@ class DataImporter:
                     episode_number INT,
                     painting_img_src VARCHAR(255),
                     painting_yt_src VARCHAR(255),
-                    air_date DATE
+                    air_date DATE,
+                    INDEX idx_title (title),
+                    INDEX idx_season_episode (season_number, episode_number)
                 )
             """,
             'colors': """
                 CREATE TABLE IF NOT EXISTS colors (
                     color_id INT AUTO_INCREMENT PRIMARY KEY,
                     color_name VARCHAR(255),
-                    color_hex VARCHAR(255)
+                    color_hex VARCHAR(255),
+                    UNIQUE KEY uq_color (color_name)
                 )
             """,
             'episode_colors': """
                 CREATE TABLE IF NOT EXISTS episode_colors (
                     episode_id INT,
                     color_id INT,
+                    INDEX idx_episode_id (episode_id),
+                    INDEX idx_color_id (color_id),
                     FOREIGN KEY (episode_id) REFERENCES episodes(episode_id),
                     FOREIGN KEY (color_id) REFERENCES colors(color_id)
                 )
@@ -90,13 +162,16 @@ class DataImporter:
             'subject_matters': """
                 CREATE TABLE IF NOT EXISTS subject_matters (
                     subject_matter_id INT AUTO_INCREMENT PRIMARY KEY,
-                    subject_matter_name VARCHAR(255)
+                    subject_matter_name VARCHAR(255),
+                    UNIQUE KEY uq_subject_matter (subject_matter_name)
                 )
             """,
             'episode_subject_matters': """
                 CREATE TABLE IF NOT EXISTS episode_subject_matters (
                     episode_id INT,
                     subject_matter_id INT,
+                    INDEX idx_episode_id (episode_id),
+                    INDEX idx_subject_matter_id (subject_matter_id),
                     FOREIGN KEY (episode_id) REFERENCES episodes(episode_id),
                     FOREIGN KEY (subject_matter_id) REFERENCES subject_matters(subject_matter_id)
                 )
@@ -107,101 +182,251 @@ class DataImporter:
             with self.db_manager.connection.cursor() as cursor:
                 for table_name, query in queries.items():
                     cursor.execute(query)
-                    print(f"Created table: {table_name}")
+                    logger.debug("Created table: %s", table_name)
             self.db_manager.connection.commit()
-        except Exception as e:
-            print(f"Error creating tables: {e}")
+        except Exception:
+            logger.exception("Error creating tables")
             raise
 
     def import_data(self) -> None:
         """Import data from CSV files into the database."""
         try:
-            # Import colors data
-            colors_data = CSVReader.read_file(
-                str(self.data_dir / 'The Joy Of Painting - Colors Used.csv'),
-                ['painting_title', 'season', 'episode', 'img_src', 'youtube_src', 'colors', 'color_hex']
-            )
+            colors_path = str(self.data_dir / 'The Joy Of Painiting - Colors Used.csv')
+            subject_matters_path = str(self.data_dir / 'The Joy Of Painiting - Subject Matter.csv')
+            dates_path = str(self.data_dir / 'The Joy Of Painting - Episode Dates.csv')
 
-            # Import subject matters
-            subject_matters_data = CSVReader.read_file(
-                str(self.data_dir / 'The Joy Of Painting - Subject Matter.csv'),
-                ['EPISODE']
-            )
+            # Each CSV is parsed once here and shared by every importer that
+            # needs it; colors rows are kept as tuples rather than dicts
+            colors_data = [
+                ColorRow._make(row)
+                for row in CSVReader.read_rows(colors_path, list(ColorRow._fields))
+            ]
 
-            # Import episode dates
-            dates_data = CSVReader.read_file(
-                str(self.data_dir / 'The Joy Of Painting - Episode Dates.csv'),
-                ['Title', 'Date']
-            )
+            # Import subject matters: one 0/1 column per subject after the
+            # EPISODE and TITLE columns
+            subject_columns = [
+                column for column in CSVReader.read_header(subject_matters_path)
+                if column not in ('EPISODE', 'TITLE')
+            ]
+            subject_matters_data = []
+            for row in CSVReader.read_rows(subject_matters_path, ['EPISODE'] + subject_columns):
+                match = EPISODE_CODE_PATTERN.match(row[0])
+                if match is None:
+                    raise ValueError(f"Unrecognised episode code {row[0]!r} in {subject_matters_path}")
+                subject_matters_data.append(SubjectMatterRow(
+                    int(match['season']),
+                    int(match['episode']),
+                    tuple(name for name, flag in zip(subject_columns, row[1:]) if flag == '1')
+                ))
+
+            # Import episode dates. Both files list the episodes in air order
+            # and titles are spelled inconsistently between them (and repeat),
+            # so pair each date with the colors row at the same position.
+            episode_dates = list(CSVReader.read_episode_dates(dates_path))
+            if len(episode_dates) != len(colors_data):
+                raise ValueError(
+                    f"{dates_path} lists {len(episode_dates)} episodes but "
+                    f"{colors_path} lists {len(colors_data)}"
+                )
+            date_by_episode = {
+                (int(row.season), int(row.episode)): air_date
+                for row, (_, air_date) in zip(colors_data, episode_dates)
+            }
 
-            self._import_episodes(colors_data, dates_data)
-            self._import_colors(colors_data)
-            self._import_subject_matters(subject_matters_data)
-            self._import_episode_colors(colors_data)
-            self._import_episode_subject_matters(subject_matters_data)
+            # Load everything in one transaction without per-row FK checks
+            connection = self.db_manager.connection
+            with connection.cursor() as cursor:
+                cursor.execute("SET foreign_key_checks=0")
+            connection.begin()
+            try:
+                self._import_episodes(colors_path, date_by_episode)
+                self._import_colors(colors_data)
+                self._import_subject_matters(subject_matters_data)
+                self._import_episode_colors(colors_data)
+                self._import_episode_subject_matters(subject_matters_data)
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+            finally:
+                # Don't let a broken connection mask the import's own error
+                try:
+                    with connection.cursor() as cursor:
+                        cursor.execute("SET foreign_key_checks=1")
+                except pymysql.MySQLError:
+                    logger.warning("Could not re-enable foreign key checks", exc_info=True)
 
-        except Exception as e:
-            print(f"Error importing data: {e}")
+        except Exception:
+            logger.exception("Error importing data")
             raise
 
-    def _import_episodes(self, colors_data: List[Dict], dates_data: List[Dict]) -> None:
-        """Import episode data into the episodes table."""
-        sql = """
-            INSERT INTO episodes 
-            (title, season_number, episode_number, painting_img_src, painting_yt_src, air_date)
-            VALUES (%s, %s, %s, %s, %s, %s)
+    def _import_episodes(self, colors_path: str, date_by_episode: Dict[Tuple[int, int], str]) -> None:
+        """Bulk-load episodes from the colors CSV and fill in their air dates."""
+        load_sql = """
+            LOAD DATA LOCAL INFILE %s
+            INTO TABLE episodes
+            FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '"'
+            IGNORE 1 LINES
+            (@row_index, @painting_index, painting_img_src, @title,
+             season_number, episode_number, @num_colors, painting_yt_src)
+            SET title = TRIM(@title)
+        """
+        dates_sql = """
+            CREATE TEMPORARY TABLE IF NOT EXISTS episode_dates (
+                season_number INT,
+                episode_number INT,
+                air_date DATE,
+                PRIMARY KEY (season_number, episode_number)
+            )
+        """
+        update_sql = """
+            UPDATE episodes
+            JOIN episode_dates
+                ON episode_dates.season_number = episodes.season_number
+                AND episode_dates.episode_number = episodes.episode_number
+            SET episodes.air_date = episode_dates.air_date
         """
         
         try:
             with self.db_manager.connection.cursor() as cursor:
-                for row in colors_data:
-                    title = row['painting_title']
-                    season = int(row['season'])
-                    episode = int(row['episode'])
-                    img_src = row['img_src']
-                    youtube_src = row['youtube_src']
-                    air_date = next((date['Date'] for date in dates_data 
-                                   if date['Title'].strip() == title), None)
-                    
-                    cursor.execute(sql, (title, season, episode, img_src, youtube_src, air_date))
-                    print(f"Inserted episode: {title}")
-            self.db_manager.connection.commit()
-        except Exception as e:
-            print(f"Error importing episodes: {e}")
+                try:
+                    cursor.execute(load_sql, (colors_path,))
+                except pymysql.MySQLError as e:
+                    if e.args[0] in LOCAL_INFILE_DISABLED_ERRORS:
+                        raise RuntimeError(
+                            "LOAD DATA LOCAL INFILE is disabled: set local_infile=ON on the "
+                            "MySQL server and pass local_infile=True in db_config"
+                        ) from e
+                    raise
+                logger.info("Inserted %s episodes", cursor.rowcount)
+
+                # Stage the dates server-side so the episode join runs in MySQL
+                cursor.execute(dates_sql)
+                cursor.executemany(
+                    "INSERT INTO episode_dates (season_number, episode_number, air_date) "
+                    "VALUES (%s, %s, %s)",
+                    [(season, episode, air_date)
+                     for (season, episode), air_date in date_by_episode.items()]
+                )
+                cursor.execute(update_sql)
+                cursor.execute("DROP TEMPORARY TABLE episode_dates")
+        except Exception:
+            logger.exception("Error importing episodes")
             raise
 
-    def _import_colors(self, colors_data: List[Dict]) -> None:
-        """Import color data into the colors table."""
-        sql = "INSERT INTO colors (color_name, color_hex) VALUES (%s, %s)"
+    def _import_colors(self, colors_data: List[ColorRow]) -> None:
+        """Import the distinct colors used across all episodes."""
+        sql = "INSERT IGNORE INTO colors (color_name, color_hex) VALUES (%s, %s)"
         
         try:
+            # Each row lists its colors as Python literals; split them into
+            # individual colors so episodes can be joined to them by name
+            color_names_hex = list(set(itertools.chain.from_iterable(
+                split_colors(row) for row in colors_data
+            )))
             with self.db_manager.connection.cursor() as cursor:
-                color_names_hex = [(row['colors'], row['color_hex']) for row in colors_data]
-                for color, hex in color_names_hex:
-                    cursor.execute(sql, (color, hex))
-                    print(f"Inserted color: {color}")
-            self.db_manager.connection.commit()
-        except Exception as e:
-            print(f"Error importing colors: {e}")
+                cursor.executemany(sql, color_names_hex)
+                logger.info("Inserted %s colors", len(color_names_hex))
+        except Exception:
+            logger.exception("Error importing colors")
             raise
 
-    def _import_subject_matters(self, subject_matters_data: List[Dict]) -> None:
+    def _import_subject_matters(self, subject_matters_data: List[SubjectMatterRow]) -> None:
         """Import subject matters into the subject_matters table."""
-        sql = "INSERT INTO subject_matters (subject_matter_name) VALUES (%s)"
+        sql = "INSERT IGNORE INTO subject_matters (subject_matter_name) VALUES (%s)"
         
         try:
+            subject_matters = set(itertools.chain.from_iterable(
+                row.subject_matters for row in subject_matters_data
+            ))
             with self.db_manager.connection.cursor() as cursor:
-                subject_matters = set()
-                for row in subject_matters_data:
-                    subjects = row['EPISODE'].split(';')
-                    subject_matters.update(subjects)
-                
-                for subject in subject_matters:
-                    cursor.execute(sql, (subject,))
-                    print(f"Inserted subject matter: {subject}")
-            self.db_manager.connection.commit()
-        except Exception as e:
-            print(f"Error importing subject matters: {e}")
+                # pymysql rewrites executemany() on INSERT ... VALUES into
+                # multi-row statements, so the SQL is parsed once per batch.
+                cursor.executemany(sql, [(subject,) for subject in subject_matters])
+                logger.info("Inserted %s subject matters", len(subject_matters))
+        except Exception:
+            logger.exception("Error importing subject matters")
+            raise
+
+    def _import_episode_colors(self, colors_data: List[ColorRow]) -> None:
+        """Link each episode to the colors it uses."""
+        staging_sql = """
+            CREATE TEMPORARY TABLE IF NOT EXISTS episode_color_names (
+                season_number INT,
+                episode_number INT,
+                color_name VARCHAR(255)
+            )
+        """
+        link_sql = """
+            INSERT INTO episode_colors (episode_id, color_id)
+            SELECT episodes.episode_id, colors.color_id
+            FROM episode_color_names
+            JOIN episodes
+                ON episodes.season_number = episode_color_names.season_number
+                AND episodes.episode_number = episode_color_names.episode_number
+            JOIN colors ON colors.color_name = episode_color_names.color_name
+        """
+
+        try:
+            rows = [
+                (int(row.season), int(row.episode), name)
+                for row in colors_data
+                for name, _ in split_colors(row)
+            ]
+            with self.db_manager.connection.cursor() as cursor:
+                # Stage the names server-side and resolve IDs in one join
+                cursor.execute(staging_sql)
+                cursor.executemany(
+                    "INSERT INTO episode_color_names (season_number, episode_number, color_name) "
+                    "VALUES (%s, %s, %s)",
+                    rows
+                )
+                cursor.execute(link_sql)
+                logger.info("Inserted %s episode colors", cursor.rowcount)
+                cursor.execute("DROP TEMPORARY TABLE episode_color_names")
+        except Exception:
+            logger.exception("Error importing episode colors")
+            raise
+
+    def _import_episode_subject_matters(self, subject_matters_data: List[SubjectMatterRow]) -> None:
+        """Link each episode to the subject matters painted in it."""
+        staging_sql = """
+            CREATE TEMPORARY TABLE IF NOT EXISTS episode_subject_matter_names (
+                season_number INT,
+                episode_number INT,
+                subject_matter_name VARCHAR(255)
+            )
+        """
+        link_sql = """
+            INSERT INTO episode_subject_matters (episode_id, subject_matter_id)
+            SELECT episodes.episode_id, subject_matters.subject_matter_id
+            FROM episode_subject_matter_names
+            JOIN episodes
+                ON episodes.season_number = episode_subject_matter_names.season_number
+                AND episodes.episode_number = episode_subject_matter_names.episode_number
+            JOIN subject_matters
+                ON subject_matters.subject_matter_name = episode_subject_matter_names.subject_matter_name
+        """
+
+        try:
+            rows = [
+                (row.season, row.episode, subject)
+                for row in subject_matters_data
+                for subject in row.subject_matters
+            ]
+            with self.db_manager.connection.cursor() as cursor:
+                # Stage the names server-side and resolve IDs in one join
+                cursor.execute(staging_sql)
+                cursor.executemany(
+                    "INSERT INTO episode_subject_matter_names "
+                    "(season_number, episode_number, subject_matter_name) VALUES (%s, %s, %s)",
+                    rows
+                )
+                cursor.execute(link_sql)
+                logger.info("Inserted %s episode subject matters", cursor.rowcount)
+                cursor.execute("DROP TEMPORARY TABLE episode_subject_matter_names")
+        except Exception:
+            logger.exception("Error importing episode subject matters")
             raise
 
 def main():
@@ -210,9 +435,13 @@ def main():
         'host': 'localhost',
         'user': 'root',
         'password': 'root',
-        'database': 'joy_of_painting'
+        'database': 'joy_of_painting',
+        # Required for LOAD DATA LOCAL INFILE bulk loads
+        'local_infile': True
     }
     
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     try:
         # Create database manager
         with DatabaseManager(db_config) as db_manager:
@@ -220,9 +449,9 @@ def main():
             importer = DataImporter(db_manager, './data')
             # Import data
             importer.import_data()
-            print("Data import completed successfully")
-    except Exception as e:
-        print(f"Error during import process: {e}")
+            logger.info("Data import completed successfully")
+    except Exception:
+        logger.exception("Error during import process")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
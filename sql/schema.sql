@@ -9,30 +9,38 @@ CREATE TABLE episodes (
     episode_number INT,
     painting_img_src VARCHAR(255),
     painting_yt_src VARCHAR(255),
-    air_date DATE
+    air_date DATE,
+    INDEX idx_title (title),
+    INDEX idx_season_episode (season_number, episode_number)
 );
 
 CREATE TABLE colors (
     color_id INT AUTO_INCREMENT PRIMARY KEY,
     color_name VARCHAR(255),
-    color_hex VARCHAR(255)
+    color_hex VARCHAR(255),
+    UNIQUE KEY uq_color (color_name)
 );
 
 CREATE TABLE episode_colors (
     episode_id INT,
     color_id INT,
+    INDEX idx_episode_id (episode_id),
+    INDEX idx_color_id (color_id),
     FOREIGN KEY (episode_id) REFERENCES episodes(episode_id),
     FOREIGN KEY (color_id) REFERENCES colors(color_id)
 );
 
 CREATE TABLE subject_matters (
     subject_matter_id INT AUTO_INCREMENT PRIMARY KEY,
-    subject_matter_name VARCHAR(255)
+    subject_matter_name VARCHAR(255),
+    UNIQUE KEY uq_subject_matter (subject_matter_name)
 );
 
 CREATE TABLE episode_subject_matters (
     episode_id INT,
     subject_matter_id INT,
+    INDEX idx_episode_id (episode_id),
+    INDEX idx_subject_matter_id (subject_matter_id),
     FOREIGN KEY (episode_id) REFERENCES episodes(episode_id),
     FOREIGN KEY (subject_matter_id) REFERENCES subject_matters(subject_matter_id)
 );
\ No newline at end of file